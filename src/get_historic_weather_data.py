@@ -1,52 +1,60 @@
-from urllib.parse import urlencode
-from urllib.request import urlopen
-from datetime import datetime
-import json
-import csv
-
-def get_env(envfile) -> dict:
-   inp   = open(envfile)
-   lines = inp.read().splitlines()
-   vars = {}
-   for line in lines:
-      key, value = line.split("=", maxsplit=1)
-      vars[key] = value
-   return vars
-
-API_KEY = get_env(".env")["WORLD_WEATHER_ONLINE_API_KEY"]
-
-base_url = 'https://api.worldweatheronline.com/premium/v1/past-weather.ashx'
-query_params = {
-   'q': 'kolkata',
-   'date': '2023-01-01',
-   'enddate': '2023-01-31',
-   'tp': '1',
-   'format': 'json',
-   'key': API_KEY
-}
-
-# Encode the query parameters
-encoded_params = urlencode(query_params)
-
-# Construct the complete URL with query parameters
-url = f"{base_url}?{encoded_params}"
-
-# Send GET request
-response = urlopen(url)
-
-json_data = json.load(response)
-
-outfile = open("input/data2.csv", "w")
-writer  = csv.writer(outfile, lineterminator="\n") 
-
-daily_data = json_data["data"]["weather"]
-for days_data in daily_data:
-   date = datetime.strptime(days_data["date"], "%Y-%m-%d")
-   for hours_data in days_data["hourly"]:
-      hour = int(hours_data["time"]) // 100
-      timestamp   = date.replace(hour=hour)
-      temperature = float(hours_data["tempC"])
-      humidity    = float(hours_data["humidity"])
-      writer.writerow([timestamp, temperature, humidity])
-
-print("Done!")
\ No newline at end of file
+from datetime import datetime
+import calendar
+import csv
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+
+def get_env(envfile) -> dict:
+   inp   = open(envfile)
+   lines = inp.read().splitlines()
+   vars = {}
+   for line in lines:
+      key, value = line.split("=", maxsplit=1)
+      vars[key] = value
+   return vars
+
+API_KEY = get_env(".env")["WORLD_WEATHER_ONLINE_API_KEY"]
+
+BASE_URL = 'https://api.worldweatheronline.com/premium/v1/past-weather.ashx'
+
+# Months of history to pull, as (year, month) pairs
+MONTHS = [(2023, 1)]
+
+# One session so every monthly request reuses the same TCP+TLS connection
+session = requests.Session()
+session.mount("https://", HTTPAdapter(max_retries=3))
+
+def fetch_month(year: int, month: int) -> dict:
+   last_day = calendar.monthrange(year, month)[1]
+   query_params = {
+      'q': 'kolkata',
+      'date': '%04d-%02d-01' % (year, month),
+      'enddate': '%04d-%02d-%02d' % (year, month, last_day),
+      'tp': '1',
+      'format': 'json',
+      'key': API_KEY
+   }
+   response = session.get(BASE_URL, params=query_params)
+   response.raise_for_status()
+   # orjson parses the nested daily/hourly arrays a few times faster
+   # than the stdlib parser behind response.json()
+   return orjson.loads(response.content)
+
+rows = []
+for year, month in MONTHS:
+   daily_data = fetch_month(year, month)["data"]["weather"]
+   for days_data in daily_data:
+      date = datetime.fromisoformat(days_data["date"])
+      for hours_data in days_data["hourly"]:
+         hour = int(hours_data["time"]) // 100
+         timestamp   = date.replace(hour=hour)
+         temperature = float(hours_data["tempC"])
+         humidity    = float(hours_data["humidity"])
+         rows.append((timestamp, temperature, humidity))
+
+outfile = open("input/data2.csv", "w")
+writer  = csv.writer(outfile, lineterminator="\n")
+writer.writerows(rows) # one C-level bulk write instead of one call per row
+
+print("Done!")
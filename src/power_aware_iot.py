@@ -1,312 +1,560 @@
-import csv
-from datetime import datetime
-import hashlib
-import struct
-import base64
-import matplotlib.pyplot as plt
-import matplotlib.colors as mcolor
-from enum import Enum, StrEnum
-
-# Enum for various format strings
-class Format(StrEnum):
-   DateTime = "%Y-%m-%d %H:%M:%S"
-   Date     = "%Y-%m-%d"
-   Time     = "%H:%M:%S"
-
-# Converts a binary checksum to utf-8 str
-def checksum_to_str(bs: bytes) -> str:
-   return base64.b64encode(bs).decode('utf-8')
-
-# Calculate the MD5 hash checksum of the frame data
-def calculate_checksum(data: bytes) -> bytes:
-   md5_hash = hashlib.md5()
-   md5_hash.update(data)
-   return md5_hash.digest()
-
-# Converts string to date using a format
-def str_to_datetime(datestr: str, format: Format) -> datetime:
-   return datetime.strptime(datestr, format)
-
-# Converts date to bytes represenation using a format
-def date_to_bytes(date: datetime, format: Format) -> bytes:
-   return date.strftime(format).encode()
-
-# Converts date to string represenation using a format
-def date_to_str(date: datetime, format: Format) -> str:
-   return date.strftime(format)
-
-# Represents the data carried by the frame
-class SensorData:
-   timestamp:   datetime
-   temperature: float
-   humidity:    float
-
-   def __init__(self, timestamp: datetime, temperature: float, humidity: float) -> None:
-      self.timestamp   = timestamp
-      self.temperature = temperature
-      self.humidity    = humidity
-
-   def __str__(self) -> str:
-      return "%s, %.2f, %.2f" % (self.timestamp, self.temperature, self.humidity)
-
-   def to_bytes(self) -> bytes:
-      return date_to_bytes(self.timestamp, Format.DateTime) + \
-             struct.pack('d', self.temperature) + \
-             struct.pack('d', self.humidity)
-
-   @staticmethod
-   def from_bytes(bs: bytes):
-      date = str_to_datetime(bs[0:19].decode(), Format.DateTime)
-      temp = struct.unpack('d', bs[19:27])[0]
-      humi = struct.unpack('d', bs[27:])[0]
-      return SensorData(date, temp, humi)
-
-# To toggle between irrigation modes
-class Signal(Enum):
-   Low  = 2
-   High = 3
-
-class SignalData:
-   timestamp: datetime
-   type: Signal
-
-   def __init__(self, timestamp: datetime, type: Signal) -> None:
-      self.timestamp = timestamp
-      self.type = type
-
-   def __str__(self) -> str:
-      return "%s, %s" % (self.timestamp, self.type)
-
-   def to_bytes(self) -> bytes:
-      return self.type.value.to_bytes()
-
-   @staticmethod
-   def from_bytes(bs: bytes):
-      return int.from_bytes(bs)
-
-SENSOR_FRAME_SIZE = 6 + 6 + 4 + 35 + 16
-
-# A data unit to carry data over a network
-class Frame[DataT: (SensorData, SignalData)]:
-   # Header
-   src: str    # Source address (6 bytes)
-   dst: str    # Destination address (6 bytes)
-   sno: int    # Frame sequence number (4 bytes)
-   # Payload
-   dta: DataT  # Data payload (35 bytes)
-   # Checksum
-   chk: bytes  # MD5 hash checksum (16 bytes)
-   
-   def __init__(self, data:        DataT,
-                      serial_no:   int, 
-                      source:      str          = "013A5B", 
-                      destination: str          = "014D8E", 
-                      checksum:    bytes | None = None ) -> None:
-      self.src = source
-      self.dst = destination
-      self.sno = serial_no
-      self.dta = data
-      self.chk = checksum if checksum else calculate_checksum(data.to_bytes())
-
-   def __str__(self) -> str:
-      return "Frame: %d\n"\
-             "  source      : %s\n" \
-             "  destination : %s\n" \
-             "  data        : %s\n" \
-             "  checksum    : %s\n" % (self.sno, self.src, self.dst, self.dta, checksum_to_str(self.chk))
-
-   # Convert the frame object to bytes representation
-   def to_bytes(self) -> bytes:
-      frame_bytes = b''
-      frame_bytes += self.src.encode()
-      frame_bytes += self.dst.encode()
-      frame_bytes += self.sno.to_bytes(4)
-      frame_bytes += self.dta.to_bytes()
-      frame_bytes += self.chk
-      return frame_bytes
-
-   @staticmethod
-   def from_bytes(bs: bytes):
-      src = bs[0:6].decode()
-      dst = bs[6:12].decode()
-      sno = int.from_bytes(bs[12:16])
-      dta = SensorData.from_bytes(bs[16:51])
-      chk = bs[51:]
-      return Frame(dta, sno, src, dst, chk)
-
-type SensorFrames     = list[Frame[SensorData]]
-type EssentialsFrames = list[Frame[SensorData]]
-type SignalFrames     = list[Frame[SignalData]]
-
-class FrameFlag(Enum):
-   HTHH = 1
-   HTLH = 2
-   LTLH = 3
-   LTHH = 4
-   MTMH = 5
-   HTMH = 6
-   LTMH = 7
-   MTLH = 8
-   MTHH = 9
-#          Frame                         SignalFrame
-# Sensor --------- Network Layer(Algo) --------------- Target Sensor(Sprinkler Irrigation Switch)
-
-# To test for Essential Frames
-class Algorithm:
-   lt: float # low  temperature
-   ht: float # high temperature
-   mt: float # mid  temperature
-   lh: float # low  humidity
-   hh: float # high humidity
-   mh: float # mid  humidity
-
-   MID_LIMIT: float = 1.5
-
-   def __init__(self, lt: float, ht: float, lh: float, hh: float) -> None:
-      self.ht = ht
-      self.lt = lt
-      self.mt = (self.ht + self.lt) / 2
-      self.hh = hh
-      self.lh = lh
-      self.mh = (self.hh + self.lh) / 2
-
-   def __str__(self) -> str:
-      return "lt: %f  ht: %f mt: %f\nlh: %f  hh: %f mh: %f" % (self.lt, self.ht, self.mt, self.lh, self.hh, self.mh)
-
-   def update(self, temp, humi) -> None:
-      if temp < self.lt: self.lt = temp # Updating Temperature
-      if temp > self.ht: self.ht = temp 
-      self.mt = (self.mt + temp) / 2
-      if humi < self.lh: self.lh = humi # Updating Humidity
-      if humi > self.hh: self.hh = humi 
-      self.mh = (self.mh + humi) / 2
-
-   def isEssential(self, frame: Frame) -> FrameFlag | None:
-      temp = frame.dta.temperature
-      humi = frame.dta.humidity
-      # Checking for essentials Frame
-      flag: FrameFlag | None
-      flag = FrameFlag.HTHH if temp >= self.ht and humi >= self.hh else \
-             FrameFlag.LTLH if temp <= self.lt and humi <= self.lh else \
-             FrameFlag.HTLH if temp >= self.ht and humi <= self.lh else \
-             FrameFlag.LTHH if temp <= self.lt and humi >= self.hh else \
-             FrameFlag.HTMH if temp >= self.ht and abs(humi - self.mh) <= self.MID_LIMIT else \
-             FrameFlag.LTMH if temp <= self.lt and abs(humi - self.mh) <= self.MID_LIMIT else \
-             FrameFlag.MTLH if abs(temp - self.mt) <= self.MID_LIMIT and humi <= self.lh else \
-             FrameFlag.MTHH if abs(temp - self.mt) <= self.MID_LIMIT and humi >= self.hh else \
-             FrameFlag.MTMH if abs(temp - self.mt) <= self.MID_LIMIT and abs(humi - self.mh) <= self.MID_LIMIT else \
-             None      
-      self.update(temp, humi)
-      return flag
-
-   # Decision support system
-   @staticmethod
-   def toggle(frame: Frame[SensorData], flag: FrameFlag) -> Frame[SignalData] | None:
-      signal_type: Signal | None
-      signal_type = Signal.Low  if flag == FrameFlag.HTHH else \
-                    Signal.High if flag == FrameFlag.LTLH else \
-                    Signal.High if flag == FrameFlag.HTLH else \
-                    Signal.Low  if flag == FrameFlag.HTMH else \
-                    Signal.Low  if flag == FrameFlag.LTMH else \
-                    Signal.High if flag == FrameFlag.MTLH else \
-                    None
-      if not signal_type: return None
-      return Frame(SignalData(frame.dta.timestamp, signal_type), frame.sno, destination="025C8H")
-
-   @staticmethod
-   def train(frames: SensorFrames):
-      temps = [frame.dta.temperature for frame in frames] # list comprehension
-      humis = [frame.dta.humidity    for frame in frames]
-      lt = min(temps)
-      ht = max(temps)
-      lh = min(humis)
-      hh = max(humis)
-      return Algorithm(lt, ht, lh, hh)
-
-def scatter_plot(frames: SensorFrames, essen_frames: EssentialsFrames, signal_frames: SignalFrames) -> None:
-   essen_dates  = [date_to_str(frame.dta.timestamp, Format.Date) for frame in essen_frames] 
-   essen_times  = [date_to_str(frame.dta.timestamp, Format.Time) for frame in essen_frames]
-   sensor_dates = [date_to_str(frame.dta.timestamp, Format.Date) for frame in frames] 
-   sensor_times = [date_to_str(frame.dta.timestamp, Format.Time) for frame in frames]
-   high_dates   = []
-   high_times   = []
-   low_dates    = []
-   low_times    = []
-   for i in range(len(signal_frames)):
-      if signal_frames[i].dta.type == Signal.High:
-         high_dates.append(date_to_str(signal_frames[i].dta.timestamp, Format.Date))
-         high_times.append(date_to_str(signal_frames[i].dta.timestamp, Format.Time))         
-      else:
-         low_dates.append(date_to_str(signal_frames[i].dta.timestamp, Format.Date))
-         low_times.append(date_to_str(signal_frames[i].dta.timestamp, Format.Time))
-   # Calculating percentage of essesntial frames
-   percentage = len(essen_times) * 100 / len(sensor_times)
-   # Plotting on a Scatter Plot graph
-   plt.figure(figsize=(10, 6))
-   plt.scatter(sensor_dates,   sensor_times, color=mcolor.CSS4_COLORS["lightskyblue"], label="Non Essential")
-   plt.scatter(essen_dates,    essen_times,  color=mcolor.CSS4_COLORS["blue"],         label="Essential")
-   plt.scatter(high_dates,     high_times,   color=mcolor.CSS4_COLORS["green"],        label="High Signal")
-   plt.scatter(low_dates,      low_times,    color=mcolor.CSS4_COLORS["red"],          label="Low Signal")
-   plt.xlabel('Frames over a period of Month')
-   plt.title("Only %.2f%% Frames are passing from Network Layer to Data Link Layer" % percentage)
-   plt.tick_params(axis='x', which='both', bottom=False, labelbottom=False)
-   plt.legend(bbox_to_anchor=(1.20,0.90), loc="right")
-   plt.show()
-
-# Generate a binary file containing frames from a csv file 
-# containing timestamp, temperature, humidity
-def csv_to_binary_file(csvfile: str, outfile: str) -> None:
-   out = open(outfile, "wb")
-   inp = open(csvfile)
-   reader = csv.reader(inp)
-   for i, line in enumerate(reader):
-      timestamp, temp, humi = line # destructuring
-      data = SensorData(str_to_datetime(timestamp, Format.DateTime), float(temp), float(humi))
-      sno = i + 1
-      out.write(Frame(data, sno).to_bytes())
-
-# Reads frame from binary file to simulate generation of frames in the sensor
-def generate_frames_from_binary(inputfile: str) -> SensorFrames:
-   inp = open(inputfile, "rb")
-   frames = []
-   while True:
-      data = inp.read(SENSOR_FRAME_SIZE)
-      if data == b'': break # read() retruns empty string when EOF is reached. 
-      frame = Frame[SensorData].from_bytes(data)
-      if frame.chk != calculate_checksum(frame.dta.to_bytes()):
-         raise ValueError("Invalid Frame")
-      frames.append(frame)
-   return frames
-
-def simulate_network_layer(sensor: SensorFrames, algo: Algorithm) -> tuple[EssentialsFrames, SignalFrames]:
-   essentials = []
-   signals = []
-   for frame in sensor:
-      flag = algo.isEssential(frame)
-      if flag is None: continue
-      essentials.append(frame)
-      signal = Algorithm.toggle(frame, flag)
-      if signal is None: continue
-      signals.append(signal)
-   return essentials, signals
-
-def print_frames[T: (SensorData, SignalData)](frames: list[Frame[T]], msg: str | None = None) -> None:
-   for i, frame in enumerate(frames):
-      if msg: print("%s: %d" % (msg, i + 1))
-      print(frame)
-
-def main():
-   # Data travels over the network in the form of binary, thats why
-   csv_to_binary_file("input/data.csv", "input/frames.bin")
-   # Represents Frame traveling over the network
-   frames  = generate_frames_from_binary("input/frames.bin")
-   sample  = frames[0:24] # Frames received on the first day
-   algo    = Algorithm.train(sample)
-   essentials, signals = simulate_network_layer(frames, algo)
-   print_frames(essentials, "Essential Frame")
-   print_frames(signals,    "Signal Frame")
-   print("Essential Frame Count: %d" % len(essentials))
-   print("   Signal Frame Count: %d" % len(signals))
-
-if __name__ == "__main__":
+from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor
+import calendar
+import hashlib
+import mmap
+import os
+import struct
+import base64
+import xxhash
+import numpy as np
+from numba import njit
+import matplotlib.pyplot as plt
+import matplotlib.colors as mcolor
+from enum import Enum
+
+# Format strings; plain str constants so hot callers skip Enum member lookup
+FMT_DATETIME = "%Y-%m-%d %H:%M:%S"
+FMT_DATE     = "%Y-%m-%d"
+FMT_TIME     = "%H:%M:%S"
+
+# Converts a binary checksum to utf-8 str
+def checksum_to_str(bs: bytes) -> str:
+   return base64.b64encode(bs).decode('utf-8')
+
+# Calculate the hash checksum of the frame data; the checksum only guards
+# against corruption so a fast non-cryptographic 128 bit hash is enough
+# and its digest fits the same 16 byte slot the md5 one did
+def calculate_checksum(data: bytes) -> bytes:
+   return xxhash.xxh3_128_digest(data)
+
+# Checksum used by frame captures older than the xxh3 switch; the digest
+# guards corruption, not security, which also skips the FIPS wrapper
+def calculate_checksum_md5(data: bytes) -> bytes:
+   return hashlib.md5(data, usedforsecurity=False).digest()
+
+# Converts string to date using a format; ISO-shaped inputs take the fast
+# C fromisoformat path instead of the generic strptime format engine
+def str_to_datetime(datestr: str, format: str = FMT_DATETIME) -> datetime:
+   if format != FMT_TIME:
+      return datetime.fromisoformat(datestr)
+   return datetime.strptime(datestr, format)
+
+# Converts date to string represenation using a format
+def date_to_str(date: datetime, format: str = FMT_DATETIME) -> str:
+   return date.strftime(format)
+
+# Precompiled layouts; on-disk byte order is little-endian
+_SENSOR_STRUCT = struct.Struct("<qdd")        # epoch seconds, temperature, humidity
+_FRAME_STRUCT  = struct.Struct("<6s6sI24s16s") # src, dst, sno, payload, checksum
+_SIGNAL_STRUCT = struct.Struct("B")            # signal type code
+
+# Represents the data carried by the frame
+class SensorData:
+   __slots__ = ("timestamp", "temperature", "humidity")
+
+   timestamp:   datetime
+   temperature: float
+   humidity:    float
+
+   def __init__(self, timestamp: datetime, temperature: float, humidity: float) -> None:
+      self.timestamp   = timestamp
+      self.temperature = temperature
+      self.humidity    = humidity
+
+   def __str__(self) -> str:
+      return "%s, %.2f, %.2f" % (self.timestamp, self.temperature, self.humidity)
+
+   # Naive timestamps are treated as UTC wall time, matching the
+   # datetime64-based bulk writer, so the round-trip is timezone independent
+   def to_bytes(self) -> bytes:
+      return _SENSOR_STRUCT.pack(calendar.timegm(self.timestamp.timetuple()), self.temperature, self.humidity)
+
+   @staticmethod
+   def from_bytes(bs: bytes):
+      epoch, temp, humi = _SENSOR_STRUCT.unpack(bs)
+      return SensorData(datetime.fromtimestamp(epoch, tz=timezone.utc).replace(tzinfo=None), temp, humi)
+
+# To toggle between irrigation modes
+class Signal(Enum):
+   Low  = 2
+   High = 3
+
+class SignalData:
+   __slots__ = ("timestamp", "type")
+
+   timestamp: datetime
+   type: Signal
+
+   def __init__(self, timestamp: datetime, type: Signal) -> None:
+      self.timestamp = timestamp
+      self.type = type
+
+   def __str__(self) -> str:
+      return "%s, %s" % (self.timestamp, self.type)
+
+   def to_bytes(self) -> bytes:
+      return _SIGNAL_STRUCT.pack(self.type.value)
+
+   @staticmethod
+   def from_bytes(bs: bytes):
+      return int.from_bytes(bs)
+
+SENSOR_FRAME_SIZE = 6 + 6 + 4 + 24 + 16
+
+# NumPy mirror of the on-disk frame layout for bulk parsing
+FRAME_DTYPE = np.dtype([("src",   "S6"),
+                        ("dst",   "S6"),
+                        ("sno",   "<u4"),
+                        ("epoch", "<i8"),
+                        ("temp",  "<f8"),
+                        ("humi",  "<f8"),
+                        ("chk",   "S16")])
+
+# Default addresses; encoded once so to_bytes need not re-encode them per frame
+DEFAULT_SRC = "013A5B"
+DEFAULT_DST = "014D8E"
+_ADDR_BYTES = {DEFAULT_SRC: DEFAULT_SRC.encode(), DEFAULT_DST: DEFAULT_DST.encode()}
+
+# Returns the cached bytes encoding of an address
+def addr_to_bytes(addr: str) -> bytes:
+   bs = _ADDR_BYTES.get(addr)
+   if bs is None:
+      bs = _ADDR_BYTES[addr] = addr.encode()
+   return bs
+
+# A data unit to carry data over a network
+class Frame[DataT: (SensorData, SignalData)]:
+   __slots__ = ("src", "dst", "sno", "dta", "chk")
+
+   # Header
+   src: str    # Source address (6 bytes)
+   dst: str    # Destination address (6 bytes)
+   sno: int    # Frame sequence number (4 bytes)
+   # Payload
+   dta: DataT  # Data payload (24 bytes)
+   # Checksum
+   chk: bytes  # xxh3_128 hash checksum (16 bytes; MD5 in legacy captures)
+   
+   def __init__(self, data:        DataT,
+                      serial_no:   int, 
+                      source:      str          = DEFAULT_SRC, 
+                      destination: str          = DEFAULT_DST, 
+                      checksum:    bytes | None = None ) -> None:
+      self.src = source
+      self.dst = destination
+      self.sno = serial_no
+      self.dta = data
+      self.chk = checksum if checksum else calculate_checksum(data.to_bytes())
+
+   def __str__(self) -> str:
+      return "Frame: %d\n"\
+             "  source      : %s\n" \
+             "  destination : %s\n" \
+             "  data        : %s\n" \
+             "  checksum    : %s\n" % (self.sno, self.src, self.dst, self.dta, checksum_to_str(self.chk))
+
+   # Convert the frame object to bytes representation
+   def to_bytes(self) -> bytes:
+      return _FRAME_STRUCT.pack(addr_to_bytes(self.src), addr_to_bytes(self.dst), self.sno, self.dta.to_bytes(), self.chk)
+
+   @staticmethod
+   def from_bytes(bs: bytes):
+      src, dst, sno, dta, chk = _FRAME_STRUCT.unpack(bs)
+      return Frame(SensorData.from_bytes(dta), sno, src.decode(), dst.decode(), chk)
+
+type SensorFrames     = list[Frame[SensorData]]
+type EssentialsFrames = list[Frame[SensorData]]
+type SignalFrames     = list[Frame[SignalData]]
+
+# Struct-of-Arrays view over sensor frames so the Algorithm can
+# test all of them in bulk instead of one object at a time; when built from
+# a parsed file it keeps the structured array so individual Frame objects
+# can be materialized lazily
+class FrameTable:
+   timestamps: np.ndarray        # datetime64[s]
+   temps:      np.ndarray        # float64
+   humis:      np.ndarray        # float64
+   snos:       np.ndarray        # uint32
+   arr:        np.ndarray | None # backing FRAME_DTYPE array, if any
+
+   def __init__(self, timestamps: np.ndarray, temps: np.ndarray, humis: np.ndarray, snos: np.ndarray,
+                      arr: np.ndarray | None = None) -> None:
+      self.timestamps = timestamps
+      self.temps      = temps
+      self.humis      = humis
+      self.snos       = snos
+      self.arr        = arr
+
+   def __len__(self) -> int:
+      return len(self.snos)
+
+   def __getitem__(self, s: slice):
+      return FrameTable(self.timestamps[s], self.temps[s], self.humis[s], self.snos[s],
+                        None if self.arr is None else self.arr[s])
+
+   # Materializes the Frame at index i; in the table pipeline only the few
+   # essential frames are worth the object construction
+   def frame_at(self, i: int) -> Frame[SensorData]:
+      if self.arr is None:
+         raise ValueError("FrameTable has no backing array to build Frames from")
+      return Frame[SensorData].from_bytes(self.arr[i].tobytes())
+
+   @staticmethod
+   def from_frames(frames: SensorFrames):
+      n = len(frames)
+      timestamps = np.array([frame.dta.timestamp for frame in frames], dtype="datetime64[s]")
+      temps      = np.fromiter((frame.dta.temperature for frame in frames), dtype=np.float64, count=n)
+      humis      = np.fromiter((frame.dta.humidity    for frame in frames), dtype=np.float64, count=n)
+      snos       = np.fromiter((frame.sno             for frame in frames), dtype=np.uint32,  count=n)
+      return FrameTable(timestamps, temps, humis, snos)
+
+   @staticmethod
+   def from_array(arr: np.ndarray):
+      return FrameTable(arr["epoch"].astype("datetime64[s]"), arr["temp"], arr["humi"], arr["sno"], arr)
+
+class FrameFlag(Enum):
+   HTHH = 1
+   HTLH = 2
+   LTLH = 3
+   LTHH = 4
+   MTMH = 5
+   HTMH = 6
+   LTMH = 7
+   MTLH = 8
+   MTHH = 9
+# FrameFlag for every combination of the six threshold predicates, built once
+# by replaying the precedence of the old comparison ladder; the index packs
+# the predicates as ht,lt,mt bits for temperature over hh,lh,mh for humidity
+def _build_flag_table() -> tuple:
+   table = []
+   for key in range(64):
+      hi_t, lo_t, mi_t = bool(key & 32), bool(key & 16), bool(key & 8)
+      hi_h, lo_h, mi_h = bool(key & 4),  bool(key & 2),  bool(key & 1)
+      flag = FrameFlag.HTHH if hi_t and hi_h else \
+             FrameFlag.LTLH if lo_t and lo_h else \
+             FrameFlag.HTLH if hi_t and lo_h else \
+             FrameFlag.LTHH if lo_t and hi_h else \
+             FrameFlag.HTMH if hi_t and mi_h else \
+             FrameFlag.LTMH if lo_t and mi_h else \
+             FrameFlag.MTLH if mi_t and lo_h else \
+             FrameFlag.MTHH if mi_t and hi_h else \
+             FrameFlag.MTMH if mi_t and mi_h else \
+             None
+      table.append(flag)
+   return tuple(table)
+
+_FLAG_TABLE = _build_flag_table()
+
+# Sequential classification kernel: replays the exact per-frame threshold
+# updates of isEssential over SoA arrays and returns the FrameFlag codes
+# (0 = not essential) plus the final thresholds. JIT-compiled because the
+# loop-carried lt/ht/mt/lh/hh/mh state defeats vectorization.
+@njit(cache=True)
+def _classify_online(temps: np.ndarray, humis: np.ndarray,
+                     lt: float, ht: float, mt: float,
+                     lh: float, hh: float, mh: float, mid: float):
+   flags = np.zeros(len(temps), dtype=np.int8)
+   for i in range(len(temps)):
+      temp = temps[i]
+      humi = humis[i]
+      hi_t = temp >= ht; lo_t = temp <= lt; mi_t = abs(temp - mt) <= mid
+      hi_h = humi >= hh; lo_h = humi <= lh; mi_h = abs(humi - mh) <= mid
+      # Same precedence as the isEssential ladder; codes are FrameFlag values
+      if   hi_t and hi_h: flags[i] = 1 # HTHH
+      elif lo_t and lo_h: flags[i] = 3 # LTLH
+      elif hi_t and lo_h: flags[i] = 2 # HTLH
+      elif lo_t and hi_h: flags[i] = 4 # LTHH
+      elif hi_t and mi_h: flags[i] = 6 # HTMH
+      elif lo_t and mi_h: flags[i] = 7 # LTMH
+      elif mi_t and lo_h: flags[i] = 8 # MTLH
+      elif mi_t and hi_h: flags[i] = 9 # MTHH
+      elif mi_t and mi_h: flags[i] = 5 # MTMH
+      if temp < lt: lt = temp
+      if temp > ht: ht = temp
+      mt = (mt + temp) / 2
+      if humi < lh: lh = humi
+      if humi > hh: hh = humi
+      mh = (mh + humi) / 2
+   return flags, lt, ht, mt, lh, hh, mh
+#          Frame                         SignalFrame
+# Sensor --------- Network Layer(Algo) --------------- Target Sensor(Sprinkler Irrigation Switch)
+
+# To test for Essential Frames
+class Algorithm:
+   __slots__ = ("lt", "ht", "mt", "lh", "hh", "mh")
+
+   lt: float # low  temperature
+   ht: float # high temperature
+   mt: float # mid  temperature
+   lh: float # low  humidity
+   hh: float # high humidity
+   mh: float # mid  humidity
+
+   MID_LIMIT: float = 1.5
+
+   def __init__(self, lt: float, ht: float, lh: float, hh: float) -> None:
+      self.ht = ht
+      self.lt = lt
+      self.mt = (self.ht + self.lt) / 2
+      self.hh = hh
+      self.lh = lh
+      self.mh = (self.hh + self.lh) / 2
+
+   def __str__(self) -> str:
+      return "lt: %f  ht: %f mt: %f\nlh: %f  hh: %f mh: %f" % (self.lt, self.ht, self.mt, self.lh, self.hh, self.mh)
+
+   def update(self, temp, humi) -> None:
+      if temp < self.lt: self.lt = temp # Updating Temperature
+      if temp > self.ht: self.ht = temp 
+      self.mt = (self.mt + temp) / 2
+      if humi < self.lh: self.lh = humi # Updating Humidity
+      if humi > self.hh: self.hh = humi 
+      self.mh = (self.mh + humi) / 2
+
+   def isEssential(self, frame: Frame) -> FrameFlag | None:
+      temp = frame.dta.temperature
+      humi = frame.dta.humidity
+      mid  = self.MID_LIMIT
+      # Checking for essentials Frame: pack the six threshold predicates
+      # into a 6 bit key and look the flag up instead of branching
+      key = (temp >= self.ht) << 5 | \
+            (temp <= self.lt) << 4 | \
+            (abs(temp - self.mt) <= mid) << 3 | \
+            (humi >= self.hh) << 2 | \
+            (humi <= self.lh) << 1 | \
+            (abs(humi - self.mh) <= mid)
+      flag = _FLAG_TABLE[key]
+      self.update(temp, humi)
+      return flag
+
+   # Vectorized isEssential over a whole FrameTable; returns an int8 array
+   # of FrameFlag values (0 where the frame is not essential). By default the
+   # thresholds are updated as if every frame was tested one by one; with
+   # freeze_thresholds the trained state is applied to all frames unchanged,
+   # which drops the sequential recurrence and is fully vectorizable
+   def isEssentialBatch(self, table: FrameTable, freeze_thresholds: bool = False) -> np.ndarray:
+      temps = table.temps
+      humis = table.humis
+      if not freeze_thresholds:
+         flags, self.lt, self.ht, self.mt, self.lh, self.hh, self.mh = \
+            _classify_online(temps, humis, self.lt, self.ht, self.mt, self.lh, self.hh, self.mh, self.MID_LIMIT)
+         return flags
+      hi_t = temps >= self.ht
+      lo_t = temps <= self.lt
+      mi_t = np.abs(temps - self.mt) <= self.MID_LIMIT
+      hi_h = humis >= self.hh
+      lo_h = humis <= self.lh
+      mi_h = np.abs(humis - self.mh) <= self.MID_LIMIT
+      # Same precedence as the isEssential ladder
+      return np.select([hi_t & hi_h, lo_t & lo_h, hi_t & lo_h, lo_t & hi_h,
+                        hi_t & mi_h, lo_t & mi_h, mi_t & lo_h, mi_t & hi_h, mi_t & mi_h],
+                       [FrameFlag.HTHH.value, FrameFlag.LTLH.value, FrameFlag.HTLH.value, FrameFlag.LTHH.value,
+                        FrameFlag.HTMH.value, FrameFlag.LTMH.value, FrameFlag.MTLH.value, FrameFlag.MTHH.value, FrameFlag.MTMH.value],
+                       default=0).astype(np.int8)
+
+   # Decision support system: the signal each essential-frame flag raises
+   # Signal per flag code, indexed by the integer FrameFlag value so the
+   # batch path can pass raw int8 codes without building Enum members
+   _SIGNAL_TABLE = (None,        # 0: not essential
+                    Signal.Low,  # HTHH
+                    Signal.High, # HTLH
+                    Signal.High, # LTLH
+                    None,        # LTHH
+                    None,        # MTMH
+                    Signal.Low,  # HTMH
+                    Signal.Low,  # LTMH
+                    Signal.High, # MTLH
+                    None)        # MTHH
+
+   @staticmethod
+   def toggle(frame: Frame[SensorData], flag: FrameFlag | int) -> Frame[SignalData] | None:
+      code = flag.value if isinstance(flag, FrameFlag) else flag
+      signal_type = Algorithm._SIGNAL_TABLE[code]
+      if not signal_type: return None
+      return Frame(SignalData(frame.dta.timestamp, signal_type), frame.sno, destination="025C8H")
+
+   @staticmethod
+   def train(frames: SensorFrames | FrameTable):
+      table = frames if isinstance(frames, FrameTable) else FrameTable.from_frames(frames)
+      return Algorithm(table.temps.min(), table.temps.max(), table.humis.min(), table.humis.max())
+
+# Splits datetime64 timestamps into numeric plot coordinates in bulk:
+# days since epoch on x, seconds of day on y. Numeric arrays let matplotlib
+# place points directly instead of mapping every string to a category tick.
+def timestamps_to_xy(timestamps: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+   seconds = timestamps.astype("datetime64[s]").astype(np.int64)
+   days    = seconds // 86400
+   return days, seconds - days * 86400
+
+def scatter_plot(frames: SensorFrames, essen_frames: EssentialsFrames, signal_frames: SignalFrames) -> None:
+   sensor = FrameTable.from_frames(frames)
+   essen  = FrameTable.from_frames(essen_frames)
+   essen_dates,  essen_times  = timestamps_to_xy(essen.timestamps)
+   sensor_dates, sensor_times = timestamps_to_xy(sensor.timestamps)
+   signal_stamps = np.array([frame.dta.timestamp for frame in signal_frames], dtype="datetime64[s]")
+   signal_dates, signal_times = timestamps_to_xy(signal_stamps)
+   high = np.fromiter((frame.dta.type == Signal.High for frame in signal_frames), dtype=bool, count=len(signal_frames))
+   # Essential frames are drawn by their own layer, so drop them from the
+   # base layer by serial-number membership instead of overplotting them
+   non_essen = ~np.isin(sensor.snos, essen.snos)
+   # Calculating percentage of essesntial frames
+   percentage = len(essen_times) * 100 / len(sensor_times)
+   # Plotting on a Scatter Plot graph
+   plt.figure(figsize=(10, 6))
+   plt.scatter(sensor_dates[non_essen], sensor_times[non_essen], color=mcolor.CSS4_COLORS["lightskyblue"], label="Non Essential")
+   plt.scatter(essen_dates,    essen_times,  color=mcolor.CSS4_COLORS["blue"],         label="Essential")
+   plt.scatter(signal_dates[high],  signal_times[high],  color=mcolor.CSS4_COLORS["green"], label="High Signal")
+   plt.scatter(signal_dates[~high], signal_times[~high], color=mcolor.CSS4_COLORS["red"],   label="Low Signal")
+   plt.xlabel('Frames over a period of Month')
+   plt.title("Only %.2f%% Frames are passing from Network Layer to Data Link Layer" % percentage)
+   plt.tick_params(axis='x', which='both', bottom=False, labelbottom=False)
+   plt.tick_params(axis='y', which='both', left=False,   labelleft=False)
+   plt.legend(bbox_to_anchor=(1.20,0.90), loc="right")
+   plt.show()
+
+# Row count below which the conversion is not worth fanning out to workers
+_PARALLEL_MIN_ROWS = 50_000
+
+# Encodes one run of csv rows into frame bytes; rows are independent so
+# runs can be handed to worker processes
+def _encode_rows(args: tuple) -> bytes:
+   start_sno, epochs, temps, humis = args
+   buf = bytearray(len(epochs) * SENSOR_FRAME_SIZE)
+   src = addr_to_bytes(DEFAULT_SRC)
+   dst = addr_to_bytes(DEFAULT_DST)
+   for i in range(len(epochs)):
+      payload = _SENSOR_STRUCT.pack(epochs[i], temps[i], humis[i])
+      _FRAME_STRUCT.pack_into(buf, i * SENSOR_FRAME_SIZE, src, dst, start_sno + i, payload, calculate_checksum(payload))
+   return bytes(buf)
+
+# Generate a binary file containing frames from a csv file
+# containing timestamp, temperature, humidity
+def csv_to_binary_file(csvfile: str, outfile: str) -> None:
+   cols = np.loadtxt(csvfile, delimiter=",", dtype=str, ndmin=2)
+   # Bulk column conversions instead of strptime/float per row
+   timestamps = cols[:, 0].astype("datetime64[s]")
+   temps      = cols[:, 1].astype(np.float64)
+   humis      = cols[:, 2].astype(np.float64)
+   # Row count is known up front, so size the file once and let the
+   # kernel write the dirty pages back instead of buffering N writes
+   n   = len(temps)
+   out = open(outfile, "w+b")
+   out.truncate(n * SENSOR_FRAME_SIZE)
+   mm  = mmap.mmap(out.fileno(), n * SENSOR_FRAME_SIZE)
+   if n >= _PARALLEL_MIN_ROWS:
+      # Shard the rows across worker processes; map keeps result order
+      epochs = timestamps.astype(np.int64)
+      step   = -(-n // (os.cpu_count() or 1)) # ceiling division
+      shards = [(lo + 1, epochs[lo:lo + step].tolist(), temps[lo:lo + step].tolist(), humis[lo:lo + step].tolist())
+                for lo in range(0, n, step)]
+      offset = 0
+      with ProcessPoolExecutor() as pool:
+         for part in pool.map(_encode_rows, shards):
+            mm[offset:offset + len(part)] = part
+            offset += len(part)
+   else:
+      # Fill the mapping column by column through the structured dtype;
+      # only the checksums still need a per-row pass
+      arr = np.frombuffer(mm, dtype=FRAME_DTYPE)
+      arr["src"]   = addr_to_bytes(DEFAULT_SRC)
+      arr["dst"]   = addr_to_bytes(DEFAULT_DST)
+      arr["sno"]   = np.arange(1, n + 1, dtype=np.uint32)
+      arr["epoch"] = timestamps.astype(np.int64)
+      arr["temp"]  = temps
+      arr["humi"]  = humis
+      payloads = np.frombuffer(mm, dtype=np.uint8).reshape(n, SENSOR_FRAME_SIZE)[:, 16:40]
+      for i in range(n):
+         offset = i * SENSOR_FRAME_SIZE
+         mm[offset + 40:offset + 56] = calculate_checksum(payloads[i].tobytes())
+      del arr, payloads # release the buffer views so the mmap can close
+   mm.close()
+   out.close()
+
+# Verifies every frame checksum in a structured-array chunk; pass
+# calculate_checksum_md5 to read captures written before the xxh3 switch
+def verify_checksums(arr: np.ndarray, checksum=calculate_checksum, base: int = 0) -> None:
+   n   = len(arr)
+   raw = arr.view(np.uint8).reshape(n, SENSOR_FRAME_SIZE)
+   payloads = raw[:, 16:40]
+   # Checksums come from the raw view; an S16 column would strip trailing nulls.
+   # Expected digests are stacked into an (n, 16) array so the comparison is a
+   # single vectorized pass instead of n bytes comparisons.
+   expected = np.frombuffer(b"".join(checksum(payloads[i].tobytes()) for i in range(n)),
+                            dtype=np.uint8).reshape(n, 16)
+   mask = (raw[:, 40:] == expected).all(axis=1)
+   if not mask.all():
+      # base is the chunk's first frame index, so the row is absolute
+      raise ValueError("Invalid Frame at row %d" % (base + np.argmax(~mask)))
+
+# Streams the binary file as verified structured-array chunks, so captures
+# far bigger than memory can still be processed batch by batch. The file is
+# memory-mapped and each chunk is a zero-copy view into the mapping; the OS
+# pages frames in on demand and the mapping is released once every view is
+# garbage collected.
+def generate_arrays_from_binary(inputfile: str, frames_per_chunk: int = 4096, checksum=calculate_checksum):
+   with open(inputfile, "rb") as inp:
+      mm = mmap.mmap(inp.fileno(), 0, access=mmap.ACCESS_READ)
+   mm.madvise(mmap.MADV_SEQUENTIAL) # read-ahead hint, pages are touched front to back
+   total = len(mm) // SENSOR_FRAME_SIZE
+   for start in range(0, total, frames_per_chunk):
+      count = min(frames_per_chunk, total - start)
+      arr = np.frombuffer(mm, dtype=FRAME_DTYPE, count=count, offset=start * SENSOR_FRAME_SIZE)
+      verify_checksums(arr, checksum, base=start)
+      yield arr
+
+# Reads the binary file into one FrameTable without materializing a Frame
+# object per record; Frames are built on demand via FrameTable.frame_at
+def generate_table_from_binary(inputfile: str) -> FrameTable:
+   arrs = list(generate_arrays_from_binary(inputfile))
+   return FrameTable.from_array(arrs[0] if len(arrs) == 1 else np.concatenate(arrs))
+
+# Reads frame from binary file to simulate generation of frames in the sensor
+def generate_frames_from_binary(inputfile: str) -> SensorFrames:
+   frames = []
+   for arr in generate_arrays_from_binary(inputfile):
+      raw = arr.view(np.uint8).reshape(len(arr), SENSOR_FRAME_SIZE)
+      # Bulk column conversions; the loop below only assembles objects
+      timestamps = arr["epoch"].astype("datetime64[s]").tolist()
+      temps      = arr["temp"].tolist()
+      humis      = arr["humi"].tolist()
+      snos       = arr["sno"].tolist()
+      srcs       = arr["src"].tolist()
+      dsts       = arr["dst"].tolist()
+      frames.extend(Frame(SensorData(timestamps[i], temps[i], humis[i]), snos[i], srcs[i].decode(), dsts[i].decode(), raw[i, 40:].tobytes())
+                    for i in range(len(arr)))
+   return frames
+
+def simulate_network_layer(sensor: SensorFrames | FrameTable, algo: Algorithm) -> tuple[EssentialsFrames, SignalFrames]:
+   table = sensor if isinstance(sensor, FrameTable) else FrameTable.from_frames(sensor)
+   flags = algo.isEssentialBatch(table)
+   essentials = []
+   signals = []
+   for i in np.flatnonzero(flags):
+      frame = table.frame_at(i) if isinstance(sensor, FrameTable) else sensor[i]
+      essentials.append(frame)
+      signal = Algorithm.toggle(frame, flags[i])
+      if signal is None: continue
+      signals.append(signal)
+   return essentials, signals
+
+def print_frames[T: (SensorData, SignalData)](frames: list[Frame[T]], msg: str | None = None) -> None:
+   for i, frame in enumerate(frames):
+      if msg: print("%s: %d" % (msg, i + 1))
+      print(frame)
+
+def main():
+   # Data travels over the network in the form of binary, thats why
+   csv_to_binary_file("input/data.csv", "input/frames.bin")
+   # Represents Frame traveling over the network
+   table   = generate_table_from_binary("input/frames.bin")
+   sample  = table[0:24] # Frames received on the first day
+   algo    = Algorithm.train(sample)
+   essentials, signals = simulate_network_layer(table, algo)
+   print_frames(essentials, "Essential Frame")
+   print_frames(signals,    "Signal Frame")
+   print("Essential Frame Count: %d" % len(essentials))
+   print("   Signal Frame Count: %d" % len(signals))
+
+if __name__ == "__main__":
    main()
\ No newline at end of file